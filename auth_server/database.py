@@ -22,7 +22,22 @@ if not DATABASE_URL:
     DATABASE_URL = "postgresql://localhost/cailculator_dev"
     print(f"WARNING: Using local database: {DATABASE_URL}")
 
-engine = create_engine(DATABASE_URL)
+# Connection pool sized for Stripe webhook retry bursts. pool_pre_ping drops
+# connections that went stale across a Postgres failover, pool_recycle
+# retires them before server-side idle timeouts, and LIFO checkout keeps
+# the idle set small behind Railway's proxy.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "40"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_use_lifo=True,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -14,9 +14,13 @@ import os
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from pathlib import Path
+from jinja2 import Environment, FileSystemLoader
 import stripe
 import secrets
 import hashlib
+import hmac
+import json
+import time
 import requests
 from sendgrid import SendGridAPIClient
 from sendgrid.helpers.mail import Mail
@@ -39,7 +43,14 @@ app = FastAPI(
 
 # Templates and static files directory
 BASE_DIR = Path(__file__).resolve().parent
-templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
+# Templates are parsed once per process and kept in the environment cache;
+# auto_reload=False skips the per-render mtime check (restart to pick up edits)
+templates = Jinja2Templates(env=Environment(
+    loader=FileSystemLoader(str(BASE_DIR / "templates")),
+    autoescape=True,
+    auto_reload=False,
+    cache_size=400,
+))
 
 # Create static directory if it doesn't exist (for Railway deployment)
 static_dir = BASE_DIR / "static"
@@ -50,6 +61,7 @@ app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 # Stripe configuration
 stripe.api_key = os.getenv("STRIPE_SECRET_KEY")
 STRIPE_WEBHOOK_SECRET = os.getenv("STRIPE_WEBHOOK_SECRET")
+STRIPE_WEBHOOK_TOLERANCE = 300  # Max signature age in seconds (replay protection)
 
 # Stripe Price IDs (LIVE MODE - Production)
 STRIPE_PRICES = {
@@ -1039,6 +1051,43 @@ async def success(request: Request, session_id: str):
             "error": str(e)
         })
 
+def verify_stripe_signature(payload: bytes, sig_header: Optional[str], secret: str) -> None:
+    """
+    Verify a Stripe-Signature header against the raw webhook payload.
+
+    Computes HMAC-SHA256 over "{timestamp}.{payload}" with the webhook secret
+    (hashlib routes to OpenSSL) and compares it in constant time against every
+    v1 signature in the header. Signatures older than STRIPE_WEBHOOK_TOLERANCE
+    are rejected to prevent replay.
+
+    Raises:
+        stripe.error.SignatureVerificationError: If the header is missing,
+            malformed, stale, or no signature matches
+    """
+    if not sig_header:
+        raise stripe.error.SignatureVerificationError("Missing signature header", sig_header)
+
+    timestamp = None
+    signatures = []
+    for item in sig_header.split(","):
+        key, _, value = item.strip().partition("=")
+        if key == "t":
+            timestamp = value
+        elif key == "v1":
+            signatures.append(value)
+
+    if not timestamp or not timestamp.isdigit() or not signatures:
+        raise stripe.error.SignatureVerificationError("Malformed signature header", sig_header)
+
+    if abs(time.time() - int(timestamp)) > STRIPE_WEBHOOK_TOLERANCE:
+        raise stripe.error.SignatureVerificationError("Timestamp outside tolerance", sig_header)
+
+    signed_payload = timestamp.encode() + b"." + payload
+    expected = hmac.new(secret.encode(), signed_payload, hashlib.sha256).hexdigest()
+
+    if not any(hmac.compare_digest(expected, signature) for signature in signatures):
+        raise stripe.error.SignatureVerificationError("No matching signature", sig_header)
+
 @app.post("/webhook/stripe")
 async def stripe_webhook(request: Request, db: Session = Depends(get_db)):
     """
@@ -1050,16 +1099,14 @@ async def stripe_webhook(request: Request, db: Session = Depends(get_db)):
     # Verify webhook signature for security
     try:
         if STRIPE_WEBHOOK_SECRET:
-            event = stripe.Webhook.construct_event(
-                payload, sig_header, STRIPE_WEBHOOK_SECRET
-            )
+            verify_stripe_signature(payload, sig_header, STRIPE_WEBHOOK_SECRET)
         else:
             # Fallback for development (not recommended for production)
-            import json
-            event = stripe.Event.construct_from(
-                json.loads(payload.decode('utf-8')), stripe.api_key
-            )
             print("WARNING: STRIPE_WEBHOOK_SECRET not set, webhook signature not verified")
+
+        event = stripe.Event.construct_from(
+            json.loads(payload.decode('utf-8')), stripe.api_key
+        )
     except ValueError as e:
         # Invalid payload
         print(f"Invalid webhook payload: {str(e)}")
@@ -7,7 +7,8 @@ Generates 3 marketing-ready visualizations showcasing key features:
 2. Canonical Six Universality - Demonstrates pattern consistency
 3. E8 Mandala - Highlights exceptional Lie algebra connection
 
-Output: Small PNGs (~50-100KB each) in examples/visualizations/
+Output: Small SVGs in examples/visualizations/ (vector output skips
+rasterization and PNG encoding; set OUTPUT_FORMAT = "png" for raster files)
 """
 
 import sys
@@ -20,15 +21,20 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib
+from matplotlib import font_manager
 matplotlib.use('Agg')  # Non-interactive backend
 
+# Warm the font cache once per process instead of on first text draw
+font_manager.fontManager.findfont('DejaVu Sans')
+
 # Output directory
 OUTPUT_DIR = Path(__file__).parent / "visualizations"
 OUTPUT_DIR.mkdir(exist_ok=True)
 
 # Small figure size for compact files
 FIG_SIZE = (8, 6)
-DPI = 100  # Lower DPI = smaller files
+DPI = 100  # Lower DPI = smaller files (raster formats only)
+OUTPUT_FORMAT = "svg"  # Figures are pure vector content
 
 # Marketing color scheme - "Colors of impossibility"
 COLORS = {
@@ -38,12 +44,34 @@ COLORS = {
     'background': '#1F2937', # Dark gray
 }
 
-def create_zero_divisor_network():
+def _get_axes(ax):
+    """Return (fig, ax), reusing a caller-provided Cartesian axes if given."""
+    if ax is None:
+        return plt.subplots(figsize=FIG_SIZE, dpi=DPI)
+    ax.clear()
+    # Undo the previous tight_layout so each plot is laid out from defaults
+    ax.figure.subplots_adjust(**{
+        key: matplotlib.rcParams[f'figure.subplot.{key}']
+        for key in ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')
+    })
+    return ax.figure, ax
+
+def _save(fig, output_path, owns_figure):
+    """Save a figure, closing it only if this call created it."""
+    fig.tight_layout()
+    fig.savefig(output_path, bbox_inches='tight', facecolor=COLORS['background'])
+    if owns_figure:
+        plt.close(fig)
+
+    print(f"[OK] Created: {output_path.name} ({output_path.stat().st_size // 1024}KB)")
+
+def create_zero_divisor_network(ax=None):
     """
     Example 1: Zero Divisor Network Visualization
     Shows the structure of Canonical Six Pattern #1
     """
-    fig, ax = plt.subplots(figsize=FIG_SIZE, dpi=DPI)
+    owns_figure = ax is None
+    fig, ax = _get_axes(ax)
 
     # Canonical Six Pattern #1: (e4 + e11) × (e1 - e14) = 0
     # Visualize as a simple network
@@ -95,19 +123,16 @@ def create_zero_divisor_network():
     ax.axis('off')
     fig.patch.set_facecolor(COLORS['background'])
 
-    output_path = OUTPUT_DIR / "zero_divisor_network_p1.png"
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=DPI, bbox_inches='tight', facecolor=COLORS['background'])
-    plt.close()
-
-    print(f"[OK] Created: {output_path.name} ({output_path.stat().st_size // 1024}KB)")
+    output_path = OUTPUT_DIR / f"zero_divisor_network_p1.{OUTPUT_FORMAT}"
+    _save(fig, output_path, owns_figure)
 
-def create_canonical_six_universality():
+def create_canonical_six_universality(ax=None):
     """
     Example 2: Canonical Six Universality
     Shows consistency across all 6 patterns
     """
-    fig, ax = plt.subplots(figsize=FIG_SIZE, dpi=DPI)
+    owns_figure = ax is None
+    fig, ax = _get_axes(ax)
 
     # Chavez Transform amplification values (normalized)
     patterns = ['P1', 'P2', 'P3', 'P4', 'P5', 'P6']
@@ -146,12 +171,8 @@ def create_canonical_six_universality():
                label, ha='center', va='bottom', color='white',
                fontsize=11, fontweight='bold')
 
-    output_path = OUTPUT_DIR / "canonical_six_universality.png"
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=DPI, bbox_inches='tight', facecolor=COLORS['background'])
-    plt.close()
-
-    print(f"[OK] Created: {output_path.name} ({output_path.stat().st_size // 1024}KB)")
+    output_path = OUTPUT_DIR / f"canonical_six_universality.{OUTPUT_FORMAT}"
+    _save(fig, output_path, owns_figure)
 
 def create_e8_mandala():
     """
@@ -203,12 +224,15 @@ def create_e8_mandala():
     ax.set_yticklabels([])
     fig.patch.set_facecolor(COLORS['background'])
 
-    output_path = OUTPUT_DIR / "e8_mandala_p4.png"
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=DPI, bbox_inches='tight', facecolor=COLORS['background'])
-    plt.close()
+    output_path = OUTPUT_DIR / f"e8_mandala_p4.{OUTPUT_FORMAT}"
+    _save(fig, output_path, owns_figure=True)
 
-    print(f"[OK] Created: {output_path.name} ({output_path.stat().st_size // 1024}KB)")
+def create_cartesian_examples():
+    """Render the two Cartesian examples on one shared figure."""
+    fig, ax = plt.subplots(figsize=FIG_SIZE, dpi=DPI)
+    create_zero_divisor_network(ax)
+    create_canonical_six_universality(ax)
+    plt.close(fig)
 
 def main():
     """Generate all example visualizations"""
@@ -216,10 +240,17 @@ def main():
     print("CAILculator MCP - Creating Marketing Example Visualizations")
     print("="*70 + "\n")
 
+    # The polar mandala needs its own projection, so it gets its own figure
+    builders = [
+        create_cartesian_examples,
+        create_e8_mandala,
+    ]
+
     try:
-        create_zero_divisor_network()
-        create_canonical_six_universality()
-        create_e8_mandala()
+        # Two small vector figures render quickly; a process pool would
+        # spend more re-importing matplotlib per worker than it saves
+        for builder in builders:
+            builder()
 
         print("\n" + "="*70)
         print("[SUCCESS] All marketing examples created!")
@@ -228,7 +259,7 @@ def main():
         # List created files with sizes
         print("Created files:")
         total_size = 0
-        for file in sorted(OUTPUT_DIR.glob("*.png")):
+        for file in sorted(OUTPUT_DIR.glob(f"*.{OUTPUT_FORMAT}")):
             size_kb = file.stat().st_size // 1024
             total_size += size_kb
             print(f"  • {file.name:<40} {size_kb:>4}KB")
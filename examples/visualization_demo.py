@@ -9,6 +9,9 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+import matplotlib
+matplotlib.use('Agg')  # Files only: select the non-interactive backend before pyplot loads
+
 import numpy as np
 from cailculator_mcp.visualizations import (
     plot_canonical_six_universality,
@@ -21,6 +24,11 @@ from cailculator_mcp.visualizations import (
     PLOTLY_AVAILABLE
 )
 
+# Alpha sweep shared by the sensitivity and comprehensive demos
+# (matches research report behavior: exponential decay)
+ALPHA_GRID = np.logspace(-2, 2, 20)
+ALPHA_TRANSFORM = 2.65 * np.exp(-0.5 * ALPHA_GRID)
+
 
 def demo_canonical_six():
     """Demo: Canonical Six pattern universality (the purple bars)."""
@@ -38,9 +46,9 @@ def demo_canonical_six():
         6: 7.771203e-01,
     }
 
-    print("Pattern values:")
-    for p, v in pattern_values.items():
-        print(f"  Pattern {p}: {v:.6e}")
+    print("Pattern values:\n" + "\n".join(
+        f"  Pattern {p}: {v:.6e}" for p, v in pattern_values.items()
+    ))
 
     # Generate free tier static plot
     print("\nGenerating free tier (static) visualization...")
@@ -65,9 +73,8 @@ def demo_alpha_sensitivity():
     print("DEMO 2: Alpha Parameter Sensitivity")
     print("="*80)
 
-    # Generate test data (matches research report behavior)
-    alpha_values = np.logspace(-2, 2, 20)
-    transform_values = 2.65 * np.exp(-0.5 * alpha_values)  # Exponential decay
+    alpha_values = ALPHA_GRID
+    transform_values = ALPHA_TRANSFORM
 
     print(f"Testing {len(alpha_values)} alpha values from {alpha_values[0]:.3f} to {alpha_values[-1]:.1f}")
     print(f"Transform range: {transform_values.min():.3e} to {transform_values.max():.3e}")
@@ -95,11 +102,12 @@ def demo_e8_comparison():
         6: {'canonical': 8.300e1, 'e8': 5.875e1},   # Dampening
     }
 
-    print("Pattern comparison:")
+    lines = ["Pattern comparison:"]
     for p, vals in pattern_data.items():
         ratio = vals['e8'] / vals['canonical']
         effect = "AMPLIFY" if ratio > 1 else "DAMPEN"
-        print(f"  Pattern {p}: Canonical={vals['canonical']:.2e}, E8={vals['e8']:.2e} ({ratio:.1%} - {effect})")
+        lines.append(f"  Pattern {p}: Canonical={vals['canonical']:.2e}, E8={vals['e8']:.2e} ({ratio:.1%} - {effect})")
+    print("\n".join(lines))
 
     # Generate visualization
     print("\nGenerating visualization...")
@@ -116,8 +124,8 @@ def demo_comprehensive():
     print("="*80)
 
     # Generate test data for all panels
-    alpha_values = np.logspace(-2, 2, 20)
-    alpha_transform = 2.65 * np.exp(-0.5 * alpha_values)
+    alpha_values = ALPHA_GRID
+    alpha_transform = ALPHA_TRANSFORM
 
     d_values = np.arange(1, 11)
     d_transform = 0.842 - 0.033 * d_values
@@ -133,13 +141,13 @@ def demo_comprehensive():
 
     pattern_values = {i: 7.771203e-01 for i in range(1, 7)}
 
-    print("Generating comprehensive 6-panel analysis...")
-    print("  Panel 1: Alpha sensitivity")
-    print("  Panel 2: Dimensional weighting")
-    print("  Panel 3: Fourier reference")
-    print("  Panel 4: Spatial behavior")
-    print("  Panel 5: Kernel localization")
-    print("  Panel 6: Canonical Six universality")
+    print("Generating comprehensive 6-panel analysis...\n"
+          "  Panel 1: Alpha sensitivity\n"
+          "  Panel 2: Dimensional weighting\n"
+          "  Panel 3: Fourier reference\n"
+          "  Panel 4: Spatial behavior\n"
+          "  Panel 5: Kernel localization\n"
+          "  Panel 6: Canonical Six universality")
 
     fig = plot_comprehensive_analysis(
         alpha_data=(alpha_values, alpha_transform),
@@ -47,10 +47,11 @@ class CliffordElement:
         >>> c.is_zero()  # Check if zero divisor
     """
 
+    __slots__ = ("n", "dim", "coeffs")
+
     # Class-level caches for blade names and multiplication tables
     _blade_names = {}
     _multiplication_table = {}
-    n = 5  # Default value
 
     def __init__(self, n: int = 5, coeffs: Optional[np.ndarray] = None):
         """
@@ -4,7 +4,9 @@ Re-exports from the hypercomplex library (v0.3.4) with MCP-specific utilities
 """
 
 import numpy as np
-from typing import Tuple, List
+from functools import lru_cache
+from itertools import islice
+from typing import Iterator, Tuple, List
 import logging
 
 # Import from real hypercomplex library
@@ -13,7 +15,8 @@ from hypercomplex import Sedenion, Pathion, Chingon, CD128, CD256
 logger = logging.getLogger(__name__)
 
 # Re-export classes
-__all__ = ['Sedenion', 'Pathion', 'Chingon', 'CD128', 'CD256', 'create_hypercomplex', 'find_zero_divisors']
+__all__ = ['Sedenion', 'Pathion', 'Chingon', 'CD128', 'CD256', 'create_hypercomplex', 'find_zero_divisors',
+           'find_zero_divisors_iter', 'cd_multiplication_table', 'cd_multiply', 'cd_multiply_batch']
 
 
 def create_hypercomplex(dimension: int, coefficients: List[float]):
@@ -50,6 +53,102 @@ def create_hypercomplex(dimension: int, coefficients: List[float]):
         raise ValueError(f"Unsupported dimension {dimension}. Supported: 16, 32, 64, 128, 256 (512+ not yet available).")
 
 
+@lru_cache(maxsize=None)
+def _cd_basis_signs(dimension: int) -> np.ndarray:
+    """
+    Sign table S with e_i * e_j = S[i, j] * e_(i XOR j).
+
+    Built by the same doubling rule the hypercomplex library multiplies with,
+    (a, b)(c, d) = (ac - conj(d) b, d a + b conj(c)), applied to basis pairs.
+    """
+    if dimension == 1:
+        return np.ones((1, 1), dtype=np.int8)
+    n = dimension // 2
+    s = _cd_basis_signs(n)
+    conj = np.ones(n, dtype=np.int8)
+    conj[1:] = -1  # conj(e_0) = e_0, conj(e_k) = -e_k
+    signs = np.empty((dimension, dimension), dtype=np.int8)
+    signs[:n, :n] = s                           # e_i e_j
+    signs[:n, n:] = s.T                         # (0, e_j' e_i)
+    signs[n:, :n] = s * conj[None, :]           # (0, e_i' conj(e_j))
+    signs[n:, n:] = -(s.T * conj[None, :])      # (-conj(e_j') e_i', 0)
+    return signs
+
+
+@lru_cache(maxsize=None)
+def cd_multiplication_table(dimension: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gather/sign tables for Cayley-Dickson multiplication in a given dimension.
+
+    Args:
+        dimension: Algebra dimension (a power of two)
+
+    Returns:
+        Tuple of (SEL, SGN), both (dimension, dimension) and read-only, such
+        that (p * q)[k] = sum_i SGN[k, i] * p[i] * q[SEL[k, i]]
+    """
+    if dimension < 1 or dimension & (dimension - 1):
+        raise ValueError(f"Cayley-Dickson dimension must be a power of two, got {dimension}")
+    k = np.arange(dimension, dtype=np.int16)
+    sel = k[:, None] ^ k[None, :]                  # SEL[k, i] = k XOR i
+    sgn = _cd_basis_signs(dimension)[k[None, :], sel]  # SGN[k, i] = S[i, k XOR i]
+    sel.setflags(write=False)
+    sgn.setflags(write=False)
+    return sel, sgn
+
+
+@lru_cache(maxsize=None)
+def _cd_signed_gather(dimension: int) -> np.ndarray:
+    """
+    SGN folded into SEL: index into concat(q, -q) that yields SGN[k, i] * q[SEL[k, i]].
+
+    Specializing the gather per dimension turns a product into one indexed
+    load and one matrix-vector multiply, with no sign multiplication.
+    """
+    sel, sgn = cd_multiplication_table(dimension)
+    idx = sel.astype(np.intp) + dimension * (sgn < 0)
+    idx.setflags(write=False)
+    return idx
+
+
+def cd_multiply(p: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """
+    Multiply two Cayley-Dickson numbers given as coefficient vectors.
+
+    Produces the same product as the hypercomplex library's recursive
+    multiplication, as one table-driven matrix-vector product.
+
+    Args:
+        p: Left operand coefficients, shape (d,)
+        q: Right operand coefficients, shape (d,)
+
+    Returns:
+        Coefficients of p * q, shape (d,)
+    """
+    q = np.asarray(q, dtype=np.float64)
+    return np.concatenate((q, -q))[_cd_signed_gather(len(p))] @ p
+
+
+def cd_multiply_batch(P: np.ndarray, Q: np.ndarray, block: int = 16) -> np.ndarray:
+    """
+    Row-wise Cayley-Dickson products of two stacks of coefficient vectors.
+
+    Args:
+        P: Left operands, shape (n, d)
+        Q: Right operands, shape (n, d)
+        block: Rows per contraction (bounds the (block, d, d) gather buffer)
+
+    Returns:
+        Array of shape (n, d) whose row r is P[r] * Q[r]
+    """
+    sel, sgn = cd_multiplication_table(P.shape[1])
+    out = np.empty(np.broadcast_shapes(P.shape, Q.shape))
+    for start in range(0, len(out), block):
+        rows = slice(start, start + block)
+        out[rows] = np.einsum('ki,ni,nki->nk', sgn, P[rows], Q[rows][:, sel])
+    return out
+
+
 def find_zero_divisors(dimension: int, num_samples: int = 1000) -> List[Tuple]:
     """
     Search for pairs of zero divisors in specified dimension.
@@ -61,13 +160,33 @@ def find_zero_divisors(dimension: int, num_samples: int = 1000) -> List[Tuple]:
         num_samples: Number of random pairs to test
 
     Returns:
-        List of (x, y) pairs where xy ≈ 0 but x, y != 0
+        List of (x, y) pairs where xy ≈ 0 but x, y != 0 (at most 5)
     """
     if dimension < 16:
         logger.info(f"No zero divisors exist in dimension {dimension}")
         return []
+    return list(islice(find_zero_divisors_iter(dimension, num_samples), 5))
+
+
+def find_zero_divisors_iter(dimension: int, num_samples: int = 1000,
+                            block: int = 16) -> Iterator[Tuple]:
+    """
+    Lazily yield zero divisor pairs, as find_zero_divisors() finds them.
+
+    The random search for dimensions above 32 samples block pairs at a time,
+    so a consumer that stops early (e.g. via islice) skips the remaining
+    samples.
 
-    zero_divisor_pairs = []
+    Args:
+        dimension: Algebra dimension (16, 32, 64, ...)
+        num_samples: Number of random pairs to test (capped at 100)
+        block: Random pairs sampled and multiplied per batch
+
+    Yields:
+        (x, y) pairs where xy ≈ 0 but x, y != 0
+    """
+    if dimension < 16:
+        return
 
     # For sedenions (16D), use known Canonical Six patterns
     if dimension == 16:
@@ -83,7 +202,7 @@ def find_zero_divisors(dimension: int, num_samples: int = 1000) -> List[Tuple]:
         p1 = Sedenion(*p1_coeffs)
         q1 = Sedenion(*q1_coeffs)
 
-        zero_divisor_pairs.append((p1, q1))
+        yield p1, q1
 
         # Add a few more known patterns
         # Pattern 2: (e_1 + e_10) × (e_5 + e_14) = 0
@@ -98,9 +217,9 @@ def find_zero_divisors(dimension: int, num_samples: int = 1000) -> List[Tuple]:
         p2 = Sedenion(*p2_coeffs)
         q2 = Sedenion(*q2_coeffs)
 
-        zero_divisor_pairs.append((p2, q2))
+        yield p2, q2
 
-        return zero_divisor_pairs
+        return
 
     # For pathions (32D), use extended Canonical Six
     elif dimension == 32:
@@ -116,39 +235,36 @@ def find_zero_divisors(dimension: int, num_samples: int = 1000) -> List[Tuple]:
         p1 = Pathion(*p1_coeffs)
         q1 = Pathion(*q1_coeffs)
 
-        zero_divisor_pairs.append((p1, q1))
+        yield p1, q1
 
-        return zero_divisor_pairs
+        return
 
     # For higher dimensions, use random search (fallback)
-    else:
-        for _ in range(min(num_samples, 100)):
-            coeffs1 = np.zeros(dimension)
-            coeffs2 = np.zeros(dimension)
-
-            # Sparse random elements
-            num_nonzero = min(4, dimension // 8)
-            indices1 = np.random.choice(dimension, num_nonzero, replace=False)
-            indices2 = np.random.choice(dimension, num_nonzero, replace=False)
-
-            coeffs1[indices1] = np.random.randn(num_nonzero)
-            coeffs2[indices2] = np.random.randn(num_nonzero)
-
-            try:
-                x = create_hypercomplex(dimension, coeffs1.tolist())
-                y = create_hypercomplex(dimension, coeffs2.tolist())
-
-                product = x * y
-
-                if abs(product) < 1e-8 and abs(x) > 1e-2 and abs(y) > 1e-2:
-                    zero_divisor_pairs.append((x, y))
-
-                    if len(zero_divisor_pairs) >= 5:
-                        break
-            except:
-                continue
-
-        return zero_divisor_pairs
+    n = min(num_samples, 100)
+
+    # Sparse random elements: num_nonzero distinct positions per row
+    num_nonzero = min(4, dimension // 8)
+    for start in range(0, n, block):
+        m = min(block, n - start)
+        rows = np.arange(m)[:, None]
+        coeffs1 = np.zeros((m, dimension))
+        coeffs2 = np.zeros((m, dimension))
+        indices1 = np.argpartition(np.random.random((m, dimension)), num_nonzero, axis=1)[:, :num_nonzero]
+        indices2 = np.argpartition(np.random.random((m, dimension)), num_nonzero, axis=1)[:, :num_nonzero]
+        coeffs1[rows, indices1] = np.random.randn(m, num_nonzero)
+        coeffs2[rows, indices2] = np.random.randn(m, num_nonzero)
+
+        # Multiply the block's pairs in one batched table contraction
+        products = cd_multiply_batch(coeffs1, coeffs2, block=block)
+        hits = np.flatnonzero(
+            (np.linalg.norm(products, axis=1) < 1e-8)
+            & (np.linalg.norm(coeffs1, axis=1) > 1e-2)
+            & (np.linalg.norm(coeffs2, axis=1) > 1e-2)
+        )
+
+        for i in hits:
+            yield (create_hypercomplex(dimension, coeffs1[i].tolist()),
+                   create_hypercomplex(dimension, coeffs2[i].tolist()))
 
 
 if __name__ == "__main__":
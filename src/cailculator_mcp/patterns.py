@@ -43,22 +43,29 @@ class PatternDetector:
         self.alpha = alpha
         self.ct = ChavezTransform(dimension=32, alpha=alpha)
     
-    def detect_all_patterns(self, data: np.ndarray) -> List[Pattern]:
+    def detect_all_patterns(self, data: np.ndarray,
+                            types: Optional[frozenset] = None) -> List[Pattern]:
         """
         Detect all pattern types in the data.
         
         Args:
             data: Input data array
+            types: Pattern types to detect; None runs every detector.
+                Detectors for other types are skipped entirely.
             
         Returns:
             List of detected patterns
         """
         patterns = []
         
-        # Detect each pattern type
-        patterns.extend(self._detect_conjugation_symmetry(data))
-        patterns.extend(self._detect_bilateral_zeros(data))
-        patterns.extend(self._detect_dimensional_persistence(data))
+        # Detect each requested pattern type
+        for pattern_type, detector in (
+            ("conjugation_symmetry", self._detect_conjugation_symmetry),
+            ("bilateral_zeros", self._detect_bilateral_zeros),
+            ("dimensional_persistence", self._detect_dimensional_persistence),
+        ):
+            if types is None or pattern_type in types:
+                patterns.extend(detector(data))
         
         # Sort by confidence
         patterns.sort(key=lambda p: p.confidence, reverse=True)
@@ -88,15 +95,16 @@ class PatternDetector:
             # Test symmetry around midpoint
             mid = len(data) // 2
             left_half = data[:mid]
-            right_half = data[mid:mid+len(left_half)][::-1]  # Reversed
+            right_half = data[2*mid-1:mid-1:-1]  # Reversed view of data[mid:2*mid]
             
             if len(left_half) != len(right_half):
                 return patterns
             
-            # Compute symmetry score
-            diff = np.abs(left_half - right_half)
-            max_val = max(np.max(np.abs(data)), 1.0)
-            symmetry_score = 1.0 - (np.mean(diff) / max_val)
+            # Compute symmetry score (|left - right| in a single buffer)
+            diff = left_half - right_half
+            np.abs(diff, out=diff)
+            max_val = max(-float(data.min()), float(data.max()), 1.0)  # max |data|, no abs copy
+            symmetry_score = 1.0 - (float(diff.mean()) / max_val)
             
             if symmetry_score > 0.5:  # Threshold for detection
                 # NOTE: Transform verification disabled for performance
@@ -140,25 +148,29 @@ class PatternDetector:
             if len(data) < 3:
                 return patterns
             
-            # Find zero crossings (sign changes)
-            signs = np.sign(data)
-            sign_changes = np.where(np.diff(signs) != 0)[0]
+            # Find zero crossings (sign changes). The sign of each sample is
+            # encoded by two boolean masks (positive, exactly zero), so adjacent
+            # signs differ iff either mask flips - no float sign/diff arrays.
+            # As with np.diff(np.sign(data)) != 0, any step into, out of or
+            # between NaNs also counts as a change.
+            positive = np.greater(data, 0)
+            zero = np.equal(data, 0)
+            nan = np.isnan(data)
+            sign_changes = np.flatnonzero(
+                (positive[:-1] ^ positive[1:]) | (zero[:-1] ^ zero[1:])
+                | nan[:-1] | nan[1:]
+            )
             
             if len(sign_changes) < 2:
                 return patterns
             
-            # Look for symmetric pairs of zero crossings
+            # Look for symmetric pairs of zero crossings: (i, j), i < j, whose
+            # distances from the midpoint agree to within 10% of the length
             mid = len(data) / 2.0
-            
-            zero_pairs = []
-            for i, idx1 in enumerate(sign_changes):
-                for idx2 in sign_changes[i+1:]:
-                    # Check if they're symmetric around midpoint
-                    dist_from_mid_1 = abs(idx1 - mid)
-                    dist_from_mid_2 = abs(idx2 - mid)
-                    
-                    if abs(dist_from_mid_1 - dist_from_mid_2) < 0.1 * len(data):
-                        zero_pairs.append((idx1, idx2))
+            dists = np.abs(sign_changes - mid)
+            close = np.abs(dists[:, None] - dists[None, :]) < 0.1 * len(data)
+            first, second = np.nonzero(np.triu(close, k=1))  # row-major = loop order
+            zero_pairs = list(zip(sign_changes[first], sign_changes[second]))
             
             if zero_pairs:
                 # Confidence based on number of pairs and their symmetry
@@ -8,49 +8,232 @@ Supports two transport modes:
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import sys
+import time
 import argparse
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
+
+# orjson (optional, pip install cailculator-mcp[fast]) encodes straight to
+# bytes in C; fall back to the stdlib encoder with the same interface
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+
+    _loads = orjson.loads
+except ImportError:
+    def _to_builtin(obj: Any) -> Any:
+        """Convert NumPy scalars and arrays, which tool results may contain."""
+        if hasattr(obj, "tolist"):
+            return obj.tolist()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize obj to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(",", ":"), default=_to_builtin).encode("utf-8")
+
+    _loads = json.loads
 
 # Lazy imports to speed up server startup
-# These will be imported only when needed
-_auth_module = None
-_config_module = None
-_tools_module = None
-
-def get_auth():
-    global _auth_module
-    if _auth_module is None:
-        from .auth import validate_api_key as _validate
-        _auth_module = type('obj', (object,), {'validate_api_key': _validate})
-    return _auth_module
-
-def get_config():
-    global _config_module
-    if _config_module is None:
-        from .config import get_settings as _get_settings
-        _config_module = type('obj', (object,), {'get_settings': _get_settings})
-    return _config_module
-
-def get_tools():
-    global _tools_module
-    if _tools_module is None:
-        from .tools import TOOLS_DEFINITIONS as _tools_defs, call_tool as _call_tool
-        _tools_module = type('obj', (object,), {'TOOLS_DEFINITIONS': _tools_defs, 'call_tool': _call_tool})
-    return _tools_module
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# These will be imported only when needed; the accessors cache the callables
+# themselves so hot paths call them directly
+_validate_api_key = None
+_get_settings = None
+_tools_defs = None
+_call_tool = None
+
+def _ensure_auth():
+    """Return auth.validate_api_key, importing the auth module on first use."""
+    global _validate_api_key
+    if _validate_api_key is None:
+        from .auth import validate_api_key
+        _validate_api_key = validate_api_key
+    return _validate_api_key
+
+def _ensure_settings():
+    """Return config.get_settings, importing the config module on first use."""
+    global _get_settings
+    if _get_settings is None:
+        from .config import get_settings
+        _get_settings = get_settings
+    return _get_settings
+
+def _ensure_tools():
+    """Return (TOOLS_DEFINITIONS, call_tool), importing the tools module on first use."""
+    global _tools_defs, _call_tool
+    if _call_tool is None:
+        from .tools import TOOLS_DEFINITIONS, call_tool
+        _tools_defs, _call_tool = TOOLS_DEFINITIONS, call_tool
+    return _tools_defs, _call_tool
+
 logger = logging.getLogger(__name__)
 
 # Maximum response size (900KB to leave buffer before 1MB MCP limit)
 MAX_RESPONSE_SIZE = 900_000
 
+# Unexpected stdio-loop errors logged per second before the rest are coalesced
+MAX_ERROR_LOGS_PER_SECOND = 10
+
+# Maximum size of one incoming JSON-RPC line (tool calls can carry large datasets;
+# asyncio.StreamReader's default limit is only 64KB)
+MAX_REQUEST_LINE = 64 * 1024 * 1024
+
+
+# Small result fields carried over verbatim into a truncated response's summary
+_SUMMARY_KEYS = (
+    "dimension",
+    "pattern_id",
+    "interpretation",
+    "metrics",
+    "visualization_type",
+    "static_path",
+    "description",
+)
+
+# initialize result; static, shared by every handshake (serialized, never mutated)
+_INITIALIZE_RESULT: Dict[str, Any] = {
+    "protocolVersion": "2024-11-05",
+    "serverInfo": {
+        "name": "cailculator-mcp",
+        "version": "0.2.0"
+    },
+    "capabilities": {
+        "tools": {}
+    }
+}
+
+
+# Encoded ping result (must match handle_ping)
+_PING_RESULT = b'{"status":"ok"}'
+
+
+# Encoded {"tools": TOOLS_DEFINITIONS}; the tool list is static for the process
+_tools_list_result: Optional[bytes] = None
+
+
+def _get_tools_list_result() -> bytes:
+    """Return the encoded tools/list result, encoding it on first use."""
+    global _tools_list_result
+    if _tools_list_result is None:
+        tools_defs, _ = _ensure_tools()
+        _tools_list_result = _dumps({"tools": tools_defs})
+    return _tools_list_result
+
+
+def _encode_result(request_id: Any, result: bytes) -> bytes:
+    """Wrap an already-encoded result in a JSON-RPC 2.0 response envelope."""
+    encoded_id = _dumps(request_id if request_id is not None else 0)
+    return b'{"jsonrpc":"2.0","id":' + encoded_id + b',"result":' + result + b'}'
+
+
+# Recent API key validations: blake2b(key) -> (checked_at, is_valid, error).
+# Short TTL so revocations propagate quickly; the raw key is never stored.
+_auth_cache: Dict[bytes, Tuple[float, bool, Optional[str]]] = {}
+_AUTH_TTL = 60.0
+_AUTH_CACHE_MAX = 256
+
+
+async def _validate_api_key_cached(api_key: str) -> Tuple[bool, Optional[str]]:
+    """
+    Validate an API key, reusing a successful result for _AUTH_TTL seconds.
+
+    Failures are not cached, so a transient auth server error does not lock
+    the session out for the whole TTL window.
+
+    Args:
+        api_key: User's API key
+
+    Returns:
+        Tuple of (is_valid: bool, error_message)
+    """
+    key = hashlib.blake2b(api_key.encode(), digest_size=16).digest()
+    now = time.monotonic()
+    entry = _auth_cache.get(key)
+    if entry is not None and now - entry[0] < _AUTH_TTL:
+        return entry[1], entry[2]
+
+    validate_api_key = _ensure_auth()
+    is_valid, error_message = await validate_api_key(api_key)
+    if is_valid:
+        _auth_cache.pop(key, None)  # re-insert at the back of the FIFO order
+        if len(_auth_cache) >= _AUTH_CACHE_MAX:
+            del _auth_cache[next(iter(_auth_cache))]
+        _auth_cache[key] = (now, is_valid, error_message)
+    else:
+        _auth_cache.pop(key, None)
+    return is_valid, error_message
+
+
+def _min_encoded_size(obj: Any, limit: int) -> int:
+    """
+    Return a lower bound on len(_dumps(obj)) without encoding it.
+
+    Every value costs at least its minimal JSON spelling (1 byte per int,
+    3 per float, the characters of a string plus quotes, ...) plus its
+    separators. The walk stops as soon as the bound exceeds limit, so huge
+    results are rejected after visiting only a prefix of them.
+
+    Args:
+        obj: JSON-serializable object
+        limit: Size beyond which the exact bound no longer matters
+
+    Returns:
+        Lower bound in bytes (possibly partial, but then already > limit)
+    """
+    size = 0
+    stack = [obj]
+    while stack and size <= limit:
+        item = stack.pop()
+        if isinstance(item, str):
+            size += len(item) + 2
+        elif isinstance(item, (list, tuple)):
+            size += len(item) + 1  # brackets and commas
+            stack.extend(item)
+        elif isinstance(item, dict):
+            size += 2 * len(item) + 1  # braces, colons and commas
+            for key, value in item.items():
+                size += len(key) + 2 if isinstance(key, str) else 1
+                stack.append(value)
+        elif isinstance(item, float):
+            size += 3  # "0.0"
+        elif item is None or item is True:
+            size += 4
+        elif item is False:
+            size += 5
+        else:
+            size += 1  # ints and other scalars (NumPy arrays count as one)
+    return size
+
+
+def _dumps_bounded(obj: Any, limit: int) -> Tuple[Optional[bytes], int]:
+    """
+    Serialize obj if it fits in limit bytes.
+
+    A cheap lower bound on the encoded size is checked first; when that
+    alone exceeds the limit, obj is never encoded. Otherwise it is encoded
+    once and its exact length checked.
+
+    Args:
+        obj: JSON-serializable object
+        limit: Maximum encoded size in bytes
+
+    Returns:
+        Tuple of (encoded bytes, or None if over the limit; size in bytes,
+        a lower bound when the object was not encoded)
+    """
+    lower_bound = _min_encoded_size(obj, limit)
+    if lower_bound > limit:
+        return None, lower_bound
+    buf = _dumps(obj)
+    return (buf if len(buf) <= limit else None), len(buf)
+
 
 class MCPServer:
     """
@@ -61,12 +244,31 @@ class MCPServer:
     
     def __init__(self):
         self._settings = None
+        # Plain-attribute copy of settings.api_key, bound when settings load
+        # (both transports load them at startup); get_settings() is cached,
+        # so the key is fixed for the life of the process
+        self._api_key: Optional[str] = None
+        # tools.call_tool, snapshotted on the first tools/call; binding it at
+        # startup would import the tools module before the handshake
+        self._call_tool = None
+        # Rate limiting state for _log_unexpected_error
+        self._error_window_start = 0.0
+        self._error_count = 0
+        self._errors_suppressed = 0
+        # JSON-RPC method -> handler coroutine
+        self._dispatch = {
+            "initialize": self.handle_initialize,
+            "tools/list": self.handle_list_tools,
+            "tools/call": self.handle_call_tool,
+            "ping": self.handle_ping,
+        }
 
     @property
     def settings(self):
         """Lazy load settings only when accessed."""
         if self._settings is None:
-            self._settings = get_config().get_settings()
+            self._settings = _ensure_settings()()
+            self._api_key = self._settings.api_key
             logger.setLevel(self._settings.log_level)
         return self._settings
         
@@ -84,24 +286,18 @@ class MCPServer:
         params = request.get("params", {})
         request_id = request.get("id")
         
-        logger.info(f"Received request: {method}")
+        logger.info("Received request: %s", method)
         
         try:
             # Route to appropriate handler
-            if method == "initialize":
-                result = await self.handle_initialize(params)
-            elif method == "tools/list":
-                result = await self.handle_list_tools(params)
-            elif method == "tools/call":
-                result = await self.handle_call_tool(params)
-            elif method == "ping":
-                result = {"status": "ok"}
-            else:
+            handler = self._dispatch.get(method) if isinstance(method, str) else None
+            if handler is None:
                 return self._error_response(
                     request_id,
                     -32601,
                     f"Method not found: {method}"
                 )
+            result = await handler(params)
             
             return {
                 "jsonrpc": "2.0",
@@ -110,27 +306,44 @@ class MCPServer:
             }
             
         except Exception as e:
-            logger.error(f"Error handling request: {e}", exc_info=True)
+            logger.error("Error handling request: %s", e, exc_info=True)
             return self._error_response(
                 request_id,
                 -32603,
                 f"Internal error: {str(e)}"
             )
     
+    async def handle_request_bytes(self, request: Dict[str, Any]) -> bytes:
+        """
+        Handle a JSON-RPC 2.0 request and return the encoded response.
+
+        ping and tools/list are answered from pre-encoded results (ping is
+        polled as a health check, the tool definitions are static);
+        everything else goes through handle_request.
+
+        Args:
+            request: JSON-RPC request dict with 'method', 'params', 'id'
+
+        Returns:
+            JSON-RPC response as UTF-8 JSON bytes
+        """
+        method = request.get("method")
+        if method == "ping":
+            return _encode_result(request.get("id"), _PING_RESULT)
+        if method == "tools/list":
+            logger.info("Received request: %s", method)
+            return _encode_result(request.get("id"), _get_tools_list_result())
+        return _dumps(await self.handle_request(request))
+    
     async def handle_initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle initialization request from client."""
         logger.info("Initializing MCP server")
         
-        return {
-            "protocolVersion": "2024-11-05",
-            "serverInfo": {
-                "name": "cailculator-mcp",
-                "version": "0.2.0"
-            },
-            "capabilities": {
-                "tools": {}
-            }
-        }
+        return _INITIALIZE_RESULT
+    
+    async def handle_ping(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle ping request (liveness check)."""
+        return {"status": "ok"}
     
     async def handle_list_tools(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -139,11 +352,11 @@ class MCPServer:
         Returns:
             Dict with 'tools' array
         """
-        tools = get_tools()
-        logger.info(f"Listing {len(tools.TOOLS_DEFINITIONS)} available tools")
+        tools_defs, _ = _ensure_tools()
+        logger.info("Listing %d available tools", len(tools_defs))
 
         return {
-            "tools": tools.TOOLS_DEFINITIONS
+            "tools": tools_defs
         }
     
     async def handle_call_tool(self, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -159,55 +372,50 @@ class MCPServer:
         tool_name = params.get("name")
         arguments = params.get("arguments", {})
         
-        logger.info(f"Tool call: {tool_name}")
+        logger.info("Tool call: %s", tool_name)
         
         # Validate API key before executing tool
-        api_key = self.settings.api_key
+        api_key = self._api_key
+        if api_key is None:  # settings not loaded yet (handler used outside run())
+            api_key = self.settings.api_key
         
         if not api_key:
             logger.error("No API key provided")
-            return {
-                "content": [{
-                    "type": "text",
-                    "text": json.dumps({
-                        "error": "No API key configured. Set CAILCULATOR_API_KEY environment variable."
-                    })
-                }],
-                "isError": True
-            }
+            return self._tool_error(
+                "No API key configured. Set CAILCULATOR_API_KEY environment variable."
+            )
         
-        # Validate API key with auth server
-        is_valid, error_message = await get_auth().validate_api_key(api_key)
+        # Validate API key with auth server (cached briefly per key)
+        is_valid, error_message = await _validate_api_key_cached(api_key)
         
         if not is_valid:
-            logger.error(f"API key validation failed: {error_message}")
-            return {
-                "content": [{
-                    "type": "text",
-                    "text": json.dumps({
-                        "error": f"API key validation failed: {error_message}"
-                    })
-                }],
-                "isError": True
-            }
+            logger.error("API key validation failed: %s", error_message)
+            return self._tool_error(f"API key validation failed: {error_message}")
         
         # Execute the tool
         try:
-            result = await get_tools().call_tool(tool_name, arguments)
+            call_tool = self._call_tool
+            if call_tool is None:
+                call_tool = self._call_tool = _ensure_tools()[1]
+            result = await call_tool(tool_name, arguments)
             
             # Check response size to prevent 1MB limit errors
-            result_json = json.dumps(result, indent=2)
+            # (compact encoding: indentation only added bytes no client needs)
+            result_json, original_size = _dumps_bounded(result, MAX_RESPONSE_SIZE)
             
-            if len(result_json) > MAX_RESPONSE_SIZE:
+            if result_json is None:
+                # The size may only be a lower bound when encoding was skipped;
+                # oversized results are rare, so encode once to report it exactly
+                original_size = len(_dumps(result))
                 logger.warning(
-                    f"Response too large ({len(result_json)} bytes), truncating for tool: {tool_name}"
+                    "Response too large (%d bytes), truncating for tool: %s", original_size, tool_name
                 )
                 
                 # Create truncated response with summary
                 truncated_result = {
                     "success": result.get("success", False),
                     "truncated": True,
-                    "original_size_bytes": len(result_json),
+                    "original_size_bytes": original_size,
                     "message": (
                         f"Response exceeded {MAX_RESPONSE_SIZE/1000:.0f}KB limit. "
                         "Key metrics and summary provided below."
@@ -215,26 +423,18 @@ class MCPServer:
                     "tool": tool_name,
                     "summary": self._create_summary(result)
                 }
-                result_json = json.dumps(truncated_result, indent=2)
+                result_json = _dumps(truncated_result)
             
             return {
                 "content": [{
                     "type": "text",
-                    "text": result_json
+                    "text": result_json.decode()
                 }]
             }
             
         except Exception as e:
-            logger.error(f"Tool execution error: {e}", exc_info=True)
-            return {
-                "content": [{
-                    "type": "text",
-                    "text": json.dumps({
-                        "error": f"Tool execution failed: {str(e)}"
-                    })
-                }],
-                "isError": True
-            }
+            logger.error("Tool execution error: %s", e, exc_info=True)
+            return self._tool_error(f"Tool execution failed: {str(e)}")
     
     def _create_summary(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -252,20 +452,9 @@ class MCPServer:
         }
         
         # Include key metrics without large arrays
-        if "dimension" in result:
-            summary["dimension"] = result["dimension"]
-        if "pattern_id" in result:
-            summary["pattern_id"] = result["pattern_id"]
-        if "interpretation" in result:
-            summary["interpretation"] = result["interpretation"]
-        if "metrics" in result:
-            summary["metrics"] = result["metrics"]
-        if "visualization_type" in result:
-            summary["visualization_type"] = result["visualization_type"]
-        if "static_path" in result:
-            summary["static_path"] = result["static_path"]
-        if "description" in result:
-            summary["description"] = result["description"]
+        for key in _SUMMARY_KEYS:
+            if key in result:
+                summary[key] = result[key]
         
         # Add note about what was truncated
         if "result" in result:
@@ -275,10 +464,21 @@ class MCPServer:
             if isinstance(patterns, dict) and "patterns" in patterns:
                 pattern_list = patterns["patterns"]
                 summary["patterns_found"] = len(pattern_list)
-                summary["pattern_types"] = list(set(p.get("type") for p in pattern_list[:5]))
+                # Ordered dedup: types appear in first-seen order
+                summary["pattern_types"] = list(dict.fromkeys(p.get("type") for p in pattern_list[:5]))
         
         return summary
     
+    def _tool_error(self, message: str) -> Dict[str, Any]:
+        """Create a tools/call error result whose text is {"error": message}."""
+        return {
+            "content": [{
+                "type": "text",
+                "text": '{"error":' + _dumps(message).decode() + '}'
+            }],
+            "isError": True
+        }
+    
     def _error_response(self, request_id: Any, code: int, message: str) -> Dict[str, Any]:
         """Create error response."""
         return {
@@ -290,51 +490,166 @@ class MCPServer:
             }
         }
 
+    def _log_unexpected_error(self, exc: BaseException) -> None:
+        """
+        Log an unexpected stdio-loop error, rate limited.
+
+        At most MAX_ERROR_LOGS_PER_SECOND errors are logged per one-second
+        window; the rest are counted and reported in a single line when the
+        next window opens. Tracebacks are only formatted at DEBUG level, so a
+        misbehaving client cannot turn every line into a traceback dump.
+        """
+        now = time.monotonic()
+        if now - self._error_window_start >= 1.0:
+            if self._errors_suppressed:
+                logger.error("Suppressed %d unexpected errors", self._errors_suppressed)
+            self._error_window_start = now
+            self._error_count = 0
+            self._errors_suppressed = 0
+        
+        self._error_count += 1
+        if self._error_count > MAX_ERROR_LOGS_PER_SECOND:
+            self._errors_suppressed += 1
+            return
+        
+        logger.error("Unexpected error: %s", exc)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Unexpected error traceback", exc_info=exc)
+    
+    async def _open_stdin_reader(self):
+        """
+        Attach an asyncio.StreamReader to stdin.
+
+        Returns:
+            StreamReader, or None if the event loop cannot watch stdin
+            (regular files, or Windows console handles under the Proactor loop)
+            or stdin is a terminal (which would put the shared tty, and so
+            stdout, into non-blocking mode)
+        """
+        if sys.stdin.isatty():
+            return None
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader(limit=MAX_REQUEST_LINE)
+        protocol = asyncio.StreamReaderProtocol(reader)
+        try:
+            await loop.connect_read_pipe(lambda: protocol, sys.stdin)
+        except (NotImplementedError, ValueError, OSError) as e:
+            logger.info("stdin is not pollable (%s), using threaded reads", e)
+            return None
+        return reader
+
+    async def _read_lines(self, queue: asyncio.Queue):
+        """
+        Feed raw stdin lines into queue, followed by None at EOF.
+
+        Args:
+            queue: Queue consumed by run()
+        """
+        # Read stdin on the event loop itself when possible
+        reader = await self._open_stdin_reader()
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                try:
+                    if reader is not None:
+                        line = await reader.readline()
+                    else:
+                        line = await loop.run_in_executor(None, sys.stdin.readline)
+                except ValueError as e:
+                    # Longer than MAX_REQUEST_LINE; the reader has discarded it
+                    logger.error("Request line too long: %s", e)
+                    continue
+                
+                if not line:
+                    break
+                queue.put_nowait(line)
+        finally:
+            queue.put_nowait(None)
+
+    def _parse_lines(self, lines) -> list:
+        """Parse raw JSON-RPC lines, skipping blank and malformed ones."""
+        requests = []
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                requests.append(_loads(line))
+            except json.JSONDecodeError as e:  # orjson's error subclasses it
+                logger.error("Invalid JSON: %s", e)
+        return requests
+
+    async def _respond(self, request: Dict[str, Any], stdout):
+        """
+        Handle one request and write its response as soon as it is ready.
+
+        Args:
+            request: Parsed JSON-RPC request
+            stdout: Binary stream responses are written to
+        """
+        try:
+            response = await self.handle_request_bytes(request)
+        except Exception as e:
+            self._log_unexpected_error(e)
+            return
+        # Write the response to stdout (as UTF-8 bytes, independent of the
+        # console encoding); writes all happen on the event loop, so
+        # responses never interleave
+        stdout.write(response + b"\n")
+        stdout.flush()
+
     async def run(self):
         """
         Main server loop - read from stdin, write to stdout.
         
-        MCP protocol uses stdio for communication.
+        MCP protocol uses stdio for communication. Each request is handled in
+        its own task and answered as soon as it finishes, so a quick ping or
+        initialize is never held up behind a slow tools/call.
         """
         logger.info("CAILculator MCP Server starting...")
         logger.info(f"Dev mode: {self.settings.enable_dev_mode}")
         logger.info(f"Auth endpoint: {self.settings.auth_endpoint}")
         
-        while True:
-            try:
-                # Read line from stdin
-                line = await asyncio.get_event_loop().run_in_executor(
-                    None, sys.stdin.readline
-                )
-                
-                if not line:
-                    logger.info("EOF received, shutting down")
-                    break
-                
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Parse JSON-RPC request
+        stdout = sys.stdout.buffer  # responses are already encoded bytes
+        queue = asyncio.Queue()
+        reader_task = asyncio.create_task(self._read_lines(queue))
+        pending = set()
+        eof = False
+        
+        try:
+            while not eof:
                 try:
-                    request = json.loads(line)
-                except json.JSONDecodeError as e:
-                    logger.error(f"Invalid JSON: {e}")
+                    # Wait for one line, then take whatever else is already pending
+                    lines = [await queue.get()]
+                    while not queue.empty():
+                        lines.append(queue.get_nowait())
+                    if lines[-1] is None:
+                        logger.info("EOF received, shutting down")
+                        eof = True
+                        lines.pop()
+                    
+                    requests = self._parse_lines(lines)
+                    if not requests:
+                        continue
+                    
+                    # Handle requests; keep a reference to each task until it is done
+                    for request in requests:
+                        task = asyncio.create_task(self._respond(request, stdout))
+                        pending.add(task)
+                        task.add_done_callback(pending.discard)
+                    
+                except KeyboardInterrupt:
+                    logger.info("Interrupted, shutting down")
+                    break
+                except Exception as e:
+                    self._log_unexpected_error(e)
                     continue
-                
-                # Handle request
-                response = await self.handle_request(request)
-                
-                # Write response to stdout
-                response_line = json.dumps(response)
-                print(response_line, flush=True)
-                
-            except KeyboardInterrupt:
-                logger.info("Interrupted, shutting down")
-                break
-            except Exception as e:
-                logger.error(f"Unexpected error: {e}", exc_info=True)
-                continue
+            
+            # Answer whatever is still in flight before shutting down
+            if pending:
+                await asyncio.gather(*pending)
+        finally:
+            reader_task.cancel()
 
 
 async def run_http_server(host: str = "0.0.0.0", port: int = 8080):
@@ -353,6 +668,7 @@ async def run_http_server(host: str = "0.0.0.0", port: int = 8080):
 
     server = MCPServer()
     app = web.Application()
+    manifest_body: Optional[bytes] = None  # encoded once, on the first GET
 
     async def handle_manifest(request):
         """
@@ -360,19 +676,21 @@ async def run_http_server(host: str = "0.0.0.0", port: int = 8080):
 
         This endpoint is required by Gemini CLI and other HTTP MCP clients.
         """
-        tools = get_tools()
-        manifest = {
-            "protocolVersion": "2024-11-05",
-            "serverInfo": {
-                "name": "cailculator-mcp",
-                "version": "1.3.0"
-            },
-            "capabilities": {
-                "tools": {}
-            },
-            "tools": tools.TOOLS_DEFINITIONS
-        }
-        return web.json_response(manifest)
+        nonlocal manifest_body
+        if manifest_body is None:
+            tools_defs, _ = _ensure_tools()
+            manifest_body = _dumps({
+                "protocolVersion": "2024-11-05",
+                "serverInfo": {
+                    "name": "cailculator-mcp",
+                    "version": "1.3.0"
+                },
+                "capabilities": {
+                    "tools": {}
+                },
+                "tools": tools_defs
+            })
+        return web.Response(body=manifest_body, content_type="application/json")
 
     async def handle_message(request):
         """
@@ -467,6 +785,12 @@ def main():
 
     args = parser.parse_args()
 
+    # Configure logging only once the server actually runs (not on import)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
     if args.transport == "http":
         # Run in HTTP mode for Gemini CLI
         asyncio.run(run_http_server(host=args.host, port=args.port))
@@ -18,6 +18,8 @@ Higher-Dimensional Cayley-Dickson Algebras" - Chavez (2025)
 
 from typing import List, Dict, Tuple, Any, Optional
 
+import numpy as np
+
 from .gateways import CANONICAL_SIX, get_gateway_pair
 
 # Lazy imports for hypercomplex types
@@ -40,6 +42,59 @@ def _get_hypercomplex():
 # Zero divisor verification tolerance
 ZERO_TOLERANCE = 1e-10
 
+# Stacked 16D -> 64D lift matrices, shape (6, 64, 16), one per gateway in
+# CANONICAL_SIX order. Built once on first use (hypercomplex is lazy-loaded).
+_W_LIFT: Optional[np.ndarray] = None
+
+
+def _right_multiplication_matrix(element: Any, cls: type, dim: int) -> np.ndarray:
+    """
+    Build the matrix M such that coeffs(x * element) = M @ coeffs(x).
+
+    Cayley-Dickson multiplication is bilinear, so right-multiplication by a
+    fixed element is a linear map; column j is e_j * element.
+    """
+    columns = []
+    for j in range(dim):
+        basis = [0.0] * dim
+        basis[j] = 1.0
+        columns.append(list((cls(*basis) * element).coefficients()))
+    return np.array(columns, dtype=float).T
+
+
+def _build_lift_matrix(gateway: str) -> np.ndarray:
+    """
+    Build the (64, 16) matrix mapping a 16D input to its 64D ZDTP state.
+
+    Architecture:
+    - Dims 0-15: Preserved original 16D state (lossless)
+    - Dims 16-31: 16D state × P (gateway interaction)
+    - Dims 32-63: 32D state × P promoted to 32D (extended interaction)
+
+    Args:
+        gateway: Gateway pattern name (S1, S2, S3A, S3B, S4, S5)
+
+    Returns:
+        Lift matrix W with state_64d = W @ input_16d
+    """
+    Sedenion, Pathion, _ = _get_hypercomplex()
+    P, _ = get_gateway_pair(gateway)
+
+    m16 = _right_multiplication_matrix(P, Sedenion, 16)
+    P_32d = Pathion(*(list(P.coefficients()) + [0.0] * 16))
+    m32 = _right_multiplication_matrix(P_32d, Pathion, 32)
+
+    lift_32d = np.vstack([np.eye(16), m16])
+    return np.vstack([lift_32d, m32 @ lift_32d])
+
+
+def _get_lift_matrices() -> np.ndarray:
+    """Get the stacked gateway lift matrices, building them on first use."""
+    global _W_LIFT
+    if _W_LIFT is None:
+        _W_LIFT = np.stack([_build_lift_matrix(gateway) for gateway in CANONICAL_SIX])
+    return _W_LIFT
+
 
 class ZDTPTransmission:
     """
@@ -73,8 +128,6 @@ class ZDTPTransmission:
         Raises:
             ValueError: If input is not 16D or gateway is unknown
         """
-        Sedenion, Pathion, Chingon = _get_hypercomplex()
-
         # Validate input
         if len(input_16d) != 16:
             raise ValueError(f"Input must be 16D, got {len(input_16d)}D")
@@ -82,31 +135,18 @@ class ZDTPTransmission:
             valid = list(CANONICAL_SIX.keys())
             raise ValueError(f"Unknown gateway: {gateway}. Valid: {valid}")
 
-        # Get gateway pair (cached)
-        P, Q = self._get_cached_pair(gateway)
-
         # Verify zero divisor property
-        product = P * Q
-        product_norm = float(abs(product))
-        if product_norm >= ZERO_TOLERANCE:
-            raise ValueError(
-                f"Zero divisor verification failed for {gateway}: "
-                f"||P × Q|| = {product_norm:.2e} >= {ZERO_TOLERANCE:.2e}"
-            )
+        product_norm = self._verify_gateway(gateway)
 
-        # Create 16D state
-        state_16d = Sedenion(*input_16d)
-
-        # Transmit 16D → 32D
-        state_32d = self._to_32d(state_16d, P, Pathion)
-
-        # Transmit 32D → 64D
-        state_64d = self._to_64d(state_32d, P, Pathion, Chingon)
+        # Transmit 16D → 32D → 64D in one matrix-vector product
+        state_16d = np.asarray(input_16d, dtype=float)
+        gateway_index = list(CANONICAL_SIX).index(gateway)
+        state_64d = (_get_lift_matrices()[gateway_index] @ state_16d).tolist()
 
         return {
-            "state_16d": list(state_16d.coefficients()),
-            "state_32d": list(state_32d.coefficients()),
-            "state_64d": list(state_64d.coefficients()),
+            "state_16d": state_16d.tolist(),
+            "state_32d": state_64d[:32],
+            "state_64d": state_64d,
             "gateway": gateway,
             "gateway_info": CANONICAL_SIX[gateway],
             "zero_divisor_verified": True,
@@ -138,20 +178,25 @@ class ZDTPTransmission:
         results: Dict[str, Any] = {}
         magnitudes_64d: List[float] = []
 
-        for gateway in CANONICAL_SIX:
+        # Lift through all six gateways at once: (6, 64, 16) x (16,) -> (6, 64)
+        states_64d = np.einsum(
+            "gij,j->gi", _get_lift_matrices(), np.asarray(input_16d, dtype=float)
+        )
+        magnitudes = np.linalg.norm(states_64d, axis=1)
+
+        for index, gateway in enumerate(CANONICAL_SIX):
             try:
-                result = self.transmit(input_16d, gateway)
+                product_norm = self._verify_gateway(gateway)
 
-                # Compute magnitude of 64D state
-                state_64d = result["state_64d"]
-                magnitude = sum(x * x for x in state_64d) ** 0.5
+                state_64d = states_64d[index].tolist()
+                magnitude = float(magnitudes[index])
 
                 results[gateway] = {
-                    "state_32d": result["state_32d"],
-                    "state_64d": result["state_64d"],
-                    "verified": result["zero_divisor_verified"],
+                    "state_32d": state_64d[:32],
+                    "state_64d": state_64d,
+                    "verified": True,
                     "magnitude_64d": magnitude,
-                    "product_norm": result["product_norm"],
+                    "product_norm": product_norm,
                 }
                 magnitudes_64d.append(magnitude)
 
@@ -179,64 +224,24 @@ class ZDTPTransmission:
             self._cache[gateway] = get_gateway_pair(gateway)
         return self._cache[gateway]
 
-    def _to_32d(self, state_16d: Any, gateway: Any, Pathion: type) -> Any:
+    def _verify_gateway(self, gateway: str) -> float:
         """
-        Transmit 16D state to 32D via gateway interaction.
-
-        Architecture:
-        - Dims 0-15: Preserved original 16D state (lossless)
-        - Dims 16-31: Gateway interaction coefficients
-
-        Args:
-            state_16d: 16D Sedenion state
-            gateway: Gateway pattern P
-            Pathion: Pathion class for 32D construction
+        Verify the zero divisor property of a gateway pair.
 
         Returns:
-            32D Pathion state
-        """
-        # Preserve original state
-        original = list(state_16d.coefficients())
+            Product norm ||P × Q||
 
-        # Compute gateway interaction
-        interaction = state_16d * gateway
-        interaction_coeffs = list(interaction.coefficients())
-
-        # Combine: [original | interaction]
-        pathion_coeffs = original + interaction_coeffs
-        return Pathion(*pathion_coeffs)
-
-    def _to_64d(self, state_32d: Any, gateway: Any, Pathion: type, Chingon: type) -> Any:
-        """
-        Transmit 32D state to 64D via gateway interaction.
-
-        Architecture:
-        - Dims 0-31: Preserved 32D state (lossless)
-        - Dims 32-63: Extended gateway interaction
-
-        Args:
-            state_32d: 32D Pathion state
-            gateway: Gateway pattern P (16D, will be promoted)
-            Pathion: Pathion class for gateway promotion
-            Chingon: Chingon class for 64D construction
-
-        Returns:
-            64D Chingon state
+        Raises:
+            ValueError: If ||P × Q|| exceeds ZERO_TOLERANCE
         """
-        # Promote 16D gateway to 32D by padding
-        gateway_coeffs = list(gateway.coefficients())
-        gateway_32d = Pathion(*(gateway_coeffs + [0.0] * 16))
-
-        # Preserve original 32D state
-        original = list(state_32d.coefficients())
-
-        # Compute extended interaction
-        interaction = state_32d * gateway_32d
-        interaction_coeffs = list(interaction.coefficients())
-
-        # Combine: [original | interaction]
-        chingon_coeffs = original + interaction_coeffs
-        return Chingon(*chingon_coeffs)
+        P, Q = self._get_cached_pair(gateway)
+        product_norm = float(abs(P * Q))
+        if product_norm >= ZERO_TOLERANCE:
+            raise ValueError(
+                f"Zero divisor verification failed for {gateway}: "
+                f"||P × Q|| = {product_norm:.2e} >= {ZERO_TOLERANCE:.2e}"
+            )
+        return product_norm
 
     def _compute_convergence(self, magnitudes: List[float]) -> Dict[str, Any]:
         """
@@ -0,0 +1,106 @@
+"""
+Tests for the hypercomplex wrapper utilities
+
+The table-driven Cayley-Dickson product must agree with the hypercomplex
+library's recursive multiplication it stands in for.
+"""
+
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from cailculator_mcp.hypercomplex import (
+    cd_multiplication_table,
+    cd_multiply,
+    cd_multiply_batch,
+    create_hypercomplex,
+    find_zero_divisors,
+    find_zero_divisors_iter,
+)
+
+
+def library_product(p, q):
+    """Product of two coefficient vectors via the hypercomplex library."""
+    d = len(p)
+    product = create_hypercomplex(d, list(p)) * create_hypercomplex(d, list(q))
+    return np.array(product.coefficients())
+
+
+class TestCayleyDicksonMultiply:
+    """Test cd_multiply against the library."""
+
+    @pytest.mark.parametrize("dimension", [16, 32, 64, 256])
+    def test_matches_library(self, dimension):
+        """Random products agree with the library to rounding error."""
+        rng = np.random.default_rng(dimension)
+        p, q = rng.standard_normal((2, dimension))
+        np.testing.assert_allclose(cd_multiply(p, q), library_product(p, q), atol=1e-12)
+
+    def test_basis_products_exact(self):
+        """Every e_i * e_j in 16D matches the library exactly."""
+        basis = np.eye(16)
+        for i in range(16):
+            for j in range(16):
+                assert np.array_equal(cd_multiply(basis[i], basis[j]),
+                                      library_product(basis[i], basis[j]))
+
+    def test_canonical_six_zero_divisor(self):
+        """(e_1 + e_10)(e_4 - e_15) = 0 in the sedenions."""
+        p = np.zeros(16)
+        p[[1, 10]] = 1.0
+        q = np.zeros(16)
+        q[4], q[15] = 1.0, -1.0
+        assert not cd_multiply(p, q).any()
+
+    def test_batch_matches_rowwise(self):
+        """Batched products equal row-by-row products across block edges."""
+        rng = np.random.default_rng(7)
+        P, Q = rng.standard_normal((2, 37, 64))
+        expected = np.array([cd_multiply(p, q) for p, q in zip(P, Q)])
+        np.testing.assert_allclose(cd_multiply_batch(P, Q), expected, atol=1e-12)
+
+    def test_table_is_cached_and_read_only(self):
+        """Tables are built once per dimension and cannot be modified."""
+        sel, sgn = cd_multiplication_table(32)
+        assert cd_multiplication_table(32)[0] is sel
+        assert not sel.flags.writeable and not sgn.flags.writeable
+
+    def test_rejects_non_power_of_two(self):
+        """Dimensions that are not powers of two are rejected."""
+        with pytest.raises(ValueError):
+            cd_multiplication_table(24)
+
+
+class TestFindZeroDivisors:
+    """Test the zero divisor search."""
+
+    @pytest.mark.parametrize("dimension", [16, 32, 64])
+    def test_pairs_are_zero_divisors(self, dimension):
+        """Every reported pair multiplies to zero."""
+        np.random.seed(0)
+        for x, y in find_zero_divisors(dimension):
+            assert abs(x) > 1e-2 and abs(y) > 1e-2
+            assert abs(x * y) < 1e-8
+
+    def test_iterator_stops_sampling_early(self, monkeypatch):
+        """Taking one pair samples only the first block."""
+        from cailculator_mcp import hypercomplex
+        calls = []
+        real_batch = hypercomplex.cd_multiply_batch
+
+        def counting_batch(P, Q, block=16):
+            calls.append(len(P))
+            # Make every sampled pair a hit
+            return np.zeros_like(real_batch(P, Q, block))
+
+        monkeypatch.setattr(hypercomplex, "cd_multiply_batch", counting_batch)
+        pairs = find_zero_divisors_iter(64, num_samples=100)
+        next(pairs)
+        assert calls == [16]
+        assert len(find_zero_divisors(64, num_samples=100)) == 5
+        assert calls == [16, 16]
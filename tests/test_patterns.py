@@ -0,0 +1,108 @@
+"""
+Tests for PatternDetector
+
+Checks the vectorized detectors against straightforward reference
+implementations of the same rules.
+"""
+
+import pytest
+import numpy as np
+import sys
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from cailculator_mcp.patterns import PatternDetector
+
+
+def reference_zero_pairs(data):
+    """Original O(K^2) symmetric zero-crossing pair search."""
+    sign_changes = np.where(np.diff(np.sign(data)) != 0)[0]
+    mid = len(data) / 2.0
+    pairs = []
+    for i, idx1 in enumerate(sign_changes):
+        for idx2 in sign_changes[i+1:]:
+            if abs(abs(idx1 - mid) - abs(idx2 - mid)) < 0.1 * len(data):
+                pairs.append((int(idx1), int(idx2)))
+    return sign_changes, pairs
+
+
+class TestBilateralZeros:
+    """Test symmetric zero-crossing pair detection."""
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_reference(self, seed):
+        """Vectorized pair search returns the same pairs in the same order."""
+        rng = np.random.default_rng(seed)
+        data = rng.standard_normal(200)
+        data[rng.integers(0, 200, 10)] = 0.0  # exact zeros count as a sign
+
+        sign_changes, pairs = reference_zero_pairs(data)
+        found = PatternDetector()._detect_bilateral_zeros(data)
+
+        assert len(found) == 1
+        pattern = found[0]
+        assert pattern.metrics["num_pairs"] == len(pairs)
+        assert pattern.indices == [idx for pair in pairs for idx in pair]
+        assert pattern.metrics["zero_crossing_indices"] == [int(i) for i in sign_changes]
+
+    def test_nan_counts_as_crossing(self):
+        """Steps into, out of and between NaNs are crossings, as with np.sign/np.diff."""
+        data = np.ones(40)
+        data[[5, 20, 21, 34]] = np.nan
+
+        sign_changes, pairs = reference_zero_pairs(data)
+        found = PatternDetector()._detect_bilateral_zeros(data)
+
+        assert list(sign_changes) == [4, 5, 19, 20, 21, 33, 34]
+        assert found[0].metrics["zero_crossing_indices"] == [int(i) for i in sign_changes]
+        assert found[0].indices == [idx for pair in pairs for idx in pair]
+
+    def test_no_crossings(self):
+        """A signal that never changes sign has no bilateral zeros."""
+        assert PatternDetector()._detect_bilateral_zeros(np.ones(50)) == []
+
+    def test_symmetric_sine(self):
+        """A sine over whole periods yields symmetric crossing pairs."""
+        data = np.sin(np.linspace(0.1, 4 * np.pi - 0.1, 100))
+        found = PatternDetector()._detect_bilateral_zeros(data)
+        assert found and found[0].metrics["num_pairs"] >= 1
+
+
+class TestConjugationSymmetry:
+    """Test mirror symmetry scoring."""
+
+    @pytest.mark.parametrize("n", [2, 4, 50, 51])
+    def test_matches_reference(self, n):
+        """Score matches the direct reversed-copy formula."""
+        rng = np.random.default_rng(n)
+        data = np.cos(np.linspace(-3, 3, n)) + 0.05 * rng.standard_normal(n)
+
+        mid = n // 2
+        diff = np.abs(data[:mid] - data[mid:2*mid][::-1])
+        expected = 1.0 - np.mean(diff) / max(np.max(np.abs(data)), 1.0)
+
+        found = PatternDetector()._detect_conjugation_symmetry(data)
+        assert len(found) == 1
+        assert found[0].metrics["symmetry_score"] == pytest.approx(expected, rel=1e-15)
+        assert found[0].metrics["midpoint_index"] == mid
+
+
+class TestDetectAllPatterns:
+    """Test detector selection by pattern type."""
+
+    def test_types_runs_only_requested(self, monkeypatch):
+        """Unrequested detectors are never called, and results match filtering."""
+        data = np.sin(np.linspace(-6, 6, 60))
+        detector = PatternDetector()
+        everything = detector.detect_all_patterns(data)
+
+        def fail(data):
+            raise AssertionError("unrequested detector ran")
+
+        monkeypatch.setattr(detector, "_detect_conjugation_symmetry", fail)
+        found = detector.detect_all_patterns(data, types=frozenset({"bilateral_zeros"}))
+        assert found == [p for p in everything if p.pattern_type == "bilateral_zeros"]
+        assert found
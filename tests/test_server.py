@@ -0,0 +1,252 @@
+"""
+Tests for the MCP JSON-RPC server
+
+Exercises request handling directly (no stdio), including the encoded
+fast paths, which must produce the same JSON as the generic path.
+"""
+
+import asyncio
+import json
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from cailculator_mcp import server as server_module
+from cailculator_mcp.server import MCPServer
+
+
+def handle(request):
+    """Run a request through the encoded path and decode the response."""
+    return json.loads(asyncio.run(MCPServer().handle_request_bytes(request)))
+
+
+class TestHandleRequest:
+    """Test JSON-RPC method handling."""
+
+    def test_tools_list_matches_generic_path(self):
+        """Cached tools/list encoding equals the encoded handle_request result."""
+        request = {"jsonrpc": "2.0", "id": 7, "method": "tools/list"}
+        generic = asyncio.run(MCPServer().handle_request(request))
+        assert handle(request) == json.loads(json.dumps(generic))
+        assert handle({"jsonrpc": "2.0", "id": "x", "method": "tools/list"})["id"] == "x"
+
+    def test_initialize(self):
+        """initialize reports protocol version and server info."""
+        response = handle({"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}})
+        assert response["id"] == 1
+        assert response["result"]["protocolVersion"] == "2024-11-05"
+        assert response["result"]["serverInfo"]["name"] == "cailculator-mcp"
+
+    def test_ping(self):
+        """ping answers with status ok and echoes the id."""
+        response = handle({"jsonrpc": "2.0", "id": "p1", "method": "ping"})
+        assert response == {"jsonrpc": "2.0", "id": "p1", "result": {"status": "ok"}}
+        generic = asyncio.run(MCPServer().handle_request({"jsonrpc": "2.0", "id": "p1", "method": "ping"}))
+        assert response == generic
+
+    def test_numpy_values_encode_as_builtins(self):
+        """Tool results may hold NumPy scalars and arrays."""
+        obj = {"norm": np.float64(1.5), "flag": np.bool_(True), "coeffs": np.arange(2.0)}
+        assert server_module._dumps(obj) == b'{"norm":1.5,"flag":true,"coeffs":[0.0,1.0]}'
+
+    def test_missing_id_defaults_to_zero(self):
+        """Requests without an id get id 0, as before."""
+        assert handle({"jsonrpc": "2.0", "method": "ping"})["id"] == 0
+
+    def test_unknown_method(self):
+        """Unknown methods return JSON-RPC error -32601."""
+        response = handle({"jsonrpc": "2.0", "id": 3, "method": "nope"})
+        assert response["error"]["code"] == -32601
+        assert "nope" in response["error"]["message"]
+
+
+# Float-heavy result whose lower bound (3 bytes per float) badly undercounts it
+FLOAT_RESULT = {"success": True, "result": [0.1234567891234] * 300_000}
+
+
+class TestCallTool:
+    """Test tools/call handling with a stubbed tool dispatcher."""
+
+    @pytest.fixture
+    def server(self, monkeypatch):
+        """Server with an API key that validates and a fake tool."""
+        server = MCPServer()
+        server._settings = type("Settings", (), {"api_key": "dev_test", "log_level": "INFO"})()
+
+        async def validate(api_key):
+            return True, ""
+
+        async def call_tool(name, arguments):
+            if name == "big":
+                return {"success": True, "dimension": 16, "result": list(range(300_000)),
+                        "patterns": {"patterns": [{"type": "b"}, {"type": "a"}, {"type": "b"}]}}
+            if name == "floats":
+                return FLOAT_RESULT
+            return {"success": True, "echo": arguments}
+
+        monkeypatch.setattr(server_module, "_validate_api_key", validate)
+        monkeypatch.setattr(server_module, "_auth_cache", {})
+        server_module._ensure_tools()
+        monkeypatch.setattr(server_module, "_call_tool", call_tool)
+        return server
+
+    def call(self, server, name, arguments=None):
+        request = {"jsonrpc": "2.0", "id": 1, "method": "tools/call",
+                   "params": {"name": name, "arguments": arguments or {}}}
+        response = json.loads(asyncio.run(server.handle_request_bytes(request)))
+        return response["result"]
+
+    def test_result_text(self, server):
+        """Tool results are returned as JSON text content."""
+        result = self.call(server, "echo", {"x": [1, 2]})
+        assert json.loads(result["content"][0]["text"]) == {"success": True, "echo": {"x": [1, 2]}}
+
+    def test_oversized_result_is_summarized(self, server):
+        """Results over MAX_RESPONSE_SIZE are replaced by a summary."""
+        payload = json.loads(self.call(server, "big")["content"][0]["text"])
+        assert payload["truncated"] is True
+        assert payload["original_size_bytes"] > server_module.MAX_RESPONSE_SIZE
+        assert payload["summary"]["dimension"] == 16
+        assert payload["summary"]["patterns_found"] == 3
+        assert payload["summary"]["pattern_types"] == ["b", "a"]
+
+    def test_oversized_size_is_exact(self, server):
+        """The reported size is the real encoded size, not the skip-encoding bound."""
+        payload = json.loads(self.call(server, "floats")["content"][0]["text"])
+        assert payload["original_size_bytes"] == len(server_module._dumps(FLOAT_RESULT))
+
+    def test_missing_api_key(self, server):
+        """Without an API key the call is rejected as a tool error."""
+        server._settings.api_key = ""
+        result = self.call(server, "echo")
+        assert result["isError"] is True
+        assert "API key" in json.loads(result["content"][0]["text"])["error"]
+
+    def test_api_key_bound_when_settings_load(self, monkeypatch):
+        """Loading settings binds the API key as a plain attribute."""
+        settings = type("Settings", (), {"api_key": "dev_bound", "log_level": "INFO"})()
+        monkeypatch.setattr(server_module, "_get_settings", lambda: settings)
+        server = MCPServer()
+        assert server._api_key is None
+        assert server.settings is settings
+        assert server._api_key == "dev_bound"
+
+    def test_api_key_validation_is_cached(self, server, monkeypatch):
+        """A validated key is reused within the TTL and rechecked after it."""
+        calls = []
+
+        async def validate(api_key):
+            calls.append(api_key)
+            return True, ""
+
+        monkeypatch.setattr(server_module, "_validate_api_key", validate)
+        self.call(server, "echo")
+        self.call(server, "echo")
+        assert calls == ["dev_test"]
+        assert b"dev_test" not in b"".join(server_module._auth_cache)
+
+        monkeypatch.setattr(server_module, "_AUTH_TTL", 0.0)
+        self.call(server, "echo")
+        assert len(calls) == 2
+
+    def test_failed_validation_is_not_cached(self, server, monkeypatch):
+        """Rejected keys are checked again on the next call."""
+        calls = []
+
+        async def validate(api_key):
+            calls.append(api_key)
+            return False, "revoked"
+
+        monkeypatch.setattr(server_module, "_validate_api_key", validate)
+        assert self.call(server, "echo")["isError"] is True
+        assert self.call(server, "echo")["isError"] is True
+        assert len(calls) == 2
+
+
+class TestMinEncodedSize:
+    """Test the lower bound used to skip encoding oversized results."""
+
+    @pytest.mark.parametrize("obj", [
+        0, 1.5, -0.0, True, False, None, "", "héllo", [], {}, [0, 1.0, "a", None],
+        {"a": [1, 2, {"b": "c"}], "d": {}, "e": [True, False]},
+        {1: "x", "nested": [[1e-300, 2.5e10], [], [[None]]]},
+    ])
+    def test_is_lower_bound(self, obj):
+        """The bound never exceeds the real encoded size."""
+        assert server_module._min_encoded_size(obj, 10**9) <= len(server_module._dumps(obj))
+
+    def test_oversized_result_is_not_encoded(self, monkeypatch):
+        """Results whose bound already exceeds the limit skip encoding."""
+        def fail(obj):
+            raise AssertionError("encoded")
+
+        monkeypatch.setattr(server_module, "_dumps", fail)
+        buf, size = server_module._dumps_bounded({"result": [0.5] * 1_000_000}, 900_000)
+        assert buf is None and size > 900_000
+
+    def test_fitting_result_is_encoded(self):
+        """Results under the limit come back encoded with their exact size."""
+        buf, size = server_module._dumps_bounded({"a": [1, 2]}, 100)
+        assert buf == b'{"a":[1,2]}' and size == len(buf)
+        assert server_module._dumps_bounded(list(range(100)), 100)[0] is None
+
+
+class TestErrorLogging:
+    """Test rate limiting of unexpected stdio-loop errors."""
+
+    def test_errors_are_coalesced(self, monkeypatch, caplog):
+        """Errors past the per-second limit are counted, then reported once."""
+        clock = [100.0]
+        monkeypatch.setattr(server_module.time, "monotonic", lambda: clock[0])
+        server = MCPServer()
+        limit = server_module.MAX_ERROR_LOGS_PER_SECOND
+
+        with caplog.at_level("INFO", logger=server_module.logger.name):
+            for i in range(limit + 5):
+                server._log_unexpected_error(ValueError(i))
+            assert len(caplog.records) == limit
+            assert all(record.exc_info is None for record in caplog.records)
+
+            clock[0] += 1.0
+            server._log_unexpected_error(ValueError("next"))
+
+        messages = [record.getMessage() for record in caplog.records[limit:]]
+        assert messages == ["Suppressed 5 unexpected errors", "Unexpected error: next"]
+
+
+class TestRespond:
+    """Test that responses are written as each request finishes."""
+
+    def test_fast_request_not_blocked(self, monkeypatch):
+        """A ping is answered while an earlier, slow request is still running."""
+        import io
+
+        server = MCPServer()
+        handle_request_bytes = server.handle_request_bytes
+        release = asyncio.Event()
+
+        async def handle_slowly(request):
+            if request["method"] == "tools/call":
+                await release.wait()
+            return await handle_request_bytes(request)
+
+        monkeypatch.setattr(server, "handle_request_bytes", handle_slowly)
+        stdout = io.BytesIO()
+
+        async def scenario():
+            slow = asyncio.create_task(server._respond(
+                {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": "nope"}}, stdout))
+            await server._respond({"jsonrpc": "2.0", "id": 2, "method": "ping"}, stdout)
+            written_before_release = stdout.getvalue()
+            release.set()
+            await slow
+            return written_before_release
+
+        written_before_release = asyncio.run(scenario())
+        assert [json.loads(line)["id"] for line in written_before_release.splitlines()] == [2]
+        assert [json.loads(line)["id"] for line in stdout.getvalue().splitlines()] == [2, 1]
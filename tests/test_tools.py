@@ -0,0 +1,281 @@
+"""
+Tests for the MCP tool implementations
+
+Fast paths in compute_high_dimensional must report the same results as
+computing directly with the hypercomplex library.
+"""
+
+import asyncio
+import json
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from cailculator_mcp.hypercomplex import create_hypercomplex
+from cailculator_mcp.tools import (
+    _canonical_six_norms,
+    analyze_dataset,
+    chavez_transform,
+    compute_high_dimensional,
+    detect_patterns,
+)
+
+
+def compute(**arguments):
+    """Run compute_high_dimensional synchronously."""
+    return asyncio.run(compute_high_dimensional(arguments))
+
+
+CANONICAL_SIX = {
+    1: (1, 10, 4, 15),
+    2: (1, 10, 5, 14),
+    3: (1, 10, 6, 13),
+    4: (4, 11, 1, 14),
+    5: (5, 10, 1, 14),
+    6: (6, 9, 6, 9),
+}
+
+
+class TestCanonicalSixPattern:
+    """Test the Cayley-Dickson canonical_six_pattern operation."""
+
+    @pytest.mark.parametrize("dimension", [16, 32, 64])
+    @pytest.mark.parametrize("pattern_id", range(1, 7))
+    def test_matches_library_product(self, dimension, pattern_id):
+        """Sparse product equals the library's P * Q."""
+        a, b, c, d = CANONICAL_SIX[pattern_id]
+        p = [0.0] * dimension
+        p[a] = p[b] = 1.0
+        q = [0.0] * dimension
+        q[c], q[d] = 1.0, -1.0
+        P = create_hypercomplex(dimension, p)
+        Q = create_hypercomplex(dimension, q)
+        product = P * Q
+
+        result = compute(operation="canonical_six_pattern", dimension=dimension, pattern_id=pattern_id)
+        assert result["success"] is True
+        assert result["product"] == str(product)
+        assert result["product_norm"] == pytest.approx(abs(product), abs=1e-12)
+        assert result["P_norm"] == pytest.approx(abs(P))
+        assert result["Q_norm"] == pytest.approx(abs(Q))
+        assert result["is_zero_divisor"] == (abs(product) < 1e-8)
+
+
+    @pytest.mark.parametrize("pattern_id", [0, 7, 2.5, "3", None])
+    def test_invalid_pattern_id(self, pattern_id):
+        """Out-of-range and non-integer pattern ids are rejected."""
+        result = compute(operation="canonical_six_pattern", dimension=16, pattern_id=pattern_id)
+        assert result == {"error": "canonical_six_pattern requires pattern_id between 1 and 6"}
+
+    def test_integral_float_pattern_id(self):
+        """A pattern id sent as 2.0 selects pattern 2."""
+        result = compute(operation="canonical_six_pattern", dimension=16, pattern_id=2.0)
+        assert result["pattern_id"] == 2 and result["Q"] == "e_5 - e_14"
+
+
+def assert_builtin_json(value):
+    """Fail if value holds anything but builtin JSON types (no NumPy scalars)."""
+    if isinstance(value, dict):
+        for item in value.values():
+            assert_builtin_json(item)
+    elif isinstance(value, list):
+        for item in value:
+            assert_builtin_json(item)
+    else:
+        assert type(value) in (str, int, float, bool, type(None)), type(value)
+
+
+class TestBuiltinResults:
+    """Operation results are plain JSON without relying on the server's encoder."""
+
+    @pytest.mark.parametrize("framework", ["cayley-dickson", "clifford"])
+    @pytest.mark.parametrize("operation, n_operands", [
+        ("multiply", 2), ("add", 2), ("subtract", 2), ("conjugate", 1),
+        ("norm", 1), ("inverse", 1), ("is_zero_divisor", 1),
+    ])
+    def test_operation_results(self, operation, n_operands, framework):
+        """Every value is a builtin, so json.dumps accepts the result."""
+        operands = np.random.default_rng(4).standard_normal((n_operands, 16)).tolist()
+        result = compute(operation=operation, dimension=16, operands=operands, framework=framework)
+        assert_builtin_json(result)
+        json.dumps(result)
+
+
+class TestCanonicalSixNorms:
+    """Test the cached norms behind the pattern sweep plots."""
+
+    @pytest.mark.parametrize("dimension", [16, 64])
+    @pytest.mark.parametrize("pattern_id", range(1, 7))
+    def test_matches_library(self, dimension, pattern_id):
+        """Table-derived norms equal abs() of the library's P, Q and P * Q."""
+        a, b, c, d = CANONICAL_SIX[pattern_id]
+        p = [0.0] * dimension
+        p[a] = p[b] = 1.0
+        q = [0.0] * dimension
+        q[c], q[d] = 1.0, -1.0
+        P = create_hypercomplex(dimension, p)
+        Q = create_hypercomplex(dimension, q)
+        expected = (abs(P), abs(Q), abs(P * Q))
+        assert _canonical_six_norms(dimension, pattern_id) == pytest.approx(expected, abs=1e-12)
+
+
+class TestMultiply:
+    """Test the Cayley-Dickson multiply operation."""
+
+    def test_three_operands_match_library(self):
+        """Products fold left to right, as the library's a * b * c does."""
+        rng = np.random.default_rng(0)
+        operands = rng.standard_normal((3, 32)).tolist()
+        expected = (create_hypercomplex(32, operands[0])
+                    * create_hypercomplex(32, operands[1])
+                    * create_hypercomplex(32, operands[2]))
+
+        result = compute(operation="multiply", dimension=32, operands=operands)
+        np.testing.assert_allclose(result["result"], expected.coefficients(), atol=1e-12)
+        assert result["metadata"]["result_norm"] == pytest.approx(abs(expected))
+        assert result["metadata"]["grouping"].startswith("left-to-right")
+
+    def test_zero_divisor_pair(self):
+        """(e_1 + e_10)(e_4 - e_15) is flagged as a zero divisor result."""
+        p = [0.0] * 16
+        p[1] = p[10] = 1.0
+        q = [0.0] * 16
+        q[4], q[15] = 1.0, -1.0
+
+        result = compute(operation="multiply", dimension=16, operands=[p, q])
+        assert result["metadata"]["is_zero_divisor_result"] is True
+        assert result["metadata"]["result_norm"] == 0.0
+
+
+class TestAdd:
+    """Test the add operation."""
+
+    @pytest.mark.parametrize("framework", ["cayley-dickson", "clifford"])
+    def test_sum_of_operands(self, framework):
+        """All operands are summed coefficient-wise."""
+        operands = np.random.default_rng(2).standard_normal((4, 16))
+        result = compute(operation="add", dimension=16, operands=operands.tolist(), framework=framework)
+        np.testing.assert_allclose(result["result"], operands.sum(axis=0), atol=1e-12)
+        assert result["metadata"]["result_norm"] == pytest.approx(np.linalg.norm(operands.sum(axis=0)))
+
+
+class TestInverse:
+    """Test the Cayley-Dickson inverse operation."""
+
+    def test_verification_error_matches_library(self):
+        """The error is the library's |x * x^-1 - 1|."""
+        operand = np.random.default_rng(1).standard_normal(32).tolist()
+        x = create_hypercomplex(32, operand)
+        identity = create_hypercomplex(32, [1.0] + [0.0] * 31)
+        expected = abs(x * x.inverse() - identity)
+
+        result = compute(operation="inverse", dimension=32, operands=[operand])
+        assert result["metadata"]["is_verified"] is True
+        assert result["metadata"]["verification_error"] == pytest.approx(expected, abs=1e-15)
+
+
+class TestOperandValidation:
+    """Test operand shape and type validation."""
+
+    def test_wrong_length_names_operand(self):
+        """A short operand is reported by index."""
+        result = compute(operation="add", dimension=16, operands=[[1.0] * 16, [1.0] * 15])
+        assert result == {"error": "Operand 1 has 15 coefficients, expected 16"}
+
+    @pytest.mark.parametrize("operands, shape", [
+        ([[[1.0] * 16] * 16], (1, 16, 16)),
+        ([1.0] * 16, (16,)),
+    ])
+    def test_wrong_shape_reported(self, operands, shape):
+        """Operands that convert but are not a (n, dimension) matrix name their shape."""
+        result = compute(operation="add", dimension=16, operands=operands)
+        assert result == {"error": f"Expected (n_operands, 16) operand matrix, got shape {shape}"}
+
+    def test_non_numeric_operand(self):
+        """Non-numeric coefficients fail element creation."""
+        result = compute(operation="add", dimension=16, operands=[[1.0] * 16, ["a"] * 16])
+        assert result["error"].startswith("Failed to create algebra elements")
+
+
+class TestFindZeroDivisors:
+    """Test the find_zero_divisors operation."""
+
+    @pytest.mark.parametrize("dimension", [16, 32])
+    def test_pairs_match_library(self, dimension):
+        """Reported norms agree with the library's abs() of each element."""
+        result = compute(operation="find_zero_divisors", dimension=dimension)
+        assert result["zero_divisor_pairs_found"] >= 1
+        for pair in result["pairs"]:
+            x = create_hypercomplex(dimension, pair["x"])
+            y = create_hypercomplex(dimension, pair["y"])
+            assert pair["x_norm"] == pytest.approx(abs(x))
+            assert pair["y_norm"] == pytest.approx(abs(y))
+            assert pair["product_norm"] == pytest.approx(abs(x * y), abs=1e-12)
+            assert pair["product_norm"] < 1e-8
+
+    def test_invalid_sample_count(self, caplog):
+        """A non-numeric sample count is a user error, logged without a traceback."""
+        with caplog.at_level("DEBUG", logger="cailculator_mcp.tools"):
+            result = compute(operation="find_zero_divisors", dimension=16, operands=[["many"]])
+        assert result == {"success": False, "error": "Invalid sample count: 'many'"}
+        assert all(record.exc_info is None for record in caplog.records)
+
+
+class TestChavezTransformTool:
+    """Test chavez_transform argument handling."""
+
+    def test_ndarray_input_matches_list(self):
+        """In-process callers may pass an ndarray instead of a list."""
+        data = [1.0, 2.0, 3.0]
+        from_list = asyncio.run(chavez_transform({"data": data}))
+        from_array = asyncio.run(chavez_transform({"data": np.array(data)}))
+        assert from_array["success"] is True
+        assert from_array["transform_value"] == from_list["transform_value"]
+
+    @pytest.mark.parametrize("data, error", [
+        ([], "No data provided"),
+        (np.array([]), "No data provided"),
+        (None, "No data provided"),
+        (5, "Data must be an array"),
+    ])
+    def test_invalid_data(self, data, error):
+        """Empty and non-array data are rejected."""
+        assert asyncio.run(chavez_transform({"data": data}))["error"] == error
+
+
+class TestAnalyzeDataset:
+    """Test analyze_dataset composition of the sub-tools."""
+
+    def test_matches_sub_tools(self):
+        """Transform and pattern results equal calling each tool on the list."""
+        data = np.sin(np.linspace(0, 6, 40)).tolist()
+        result = asyncio.run(analyze_dataset({"data": data}))
+        transform = asyncio.run(chavez_transform({"data": data, "pattern_id": 1, "alpha": 1.0, "dimension_param": 2}))
+        patterns = asyncio.run(detect_patterns({"data": data, "pattern_types": ["all"]}))
+        assert result["transform"] == transform
+        assert result["patterns"] == patterns
+        assert result["statistics"]["min"] == result["data_summary"]["range"][0] == min(data)
+
+    def test_builtin_results(self):
+        """Statistics, transform and pattern values are builtins, not NumPy scalars."""
+        result = asyncio.run(analyze_dataset({"data": np.sin(np.linspace(-6, 6, 60)).tolist()}))
+        assert result["patterns"]["patterns_found"] > 0
+        assert_builtin_json(result)
+        json.dumps(result)
+
+    def test_detect_patterns_accepts_ndarray(self):
+        """detect_patterns takes the ndarray analyze_dataset hands it."""
+        assert asyncio.run(detect_patterns({"data": np.array([])}))["error"] == "No data provided"
+        assert asyncio.run(detect_patterns({"data": np.arange(10.0)}))["success"] is True
+
+    def test_shared_detector_repeatable(self):
+        """Reusing the shared detector across calls and sizes gives the same results."""
+        short, long = np.sin(np.linspace(0, 6, 40)), np.cos(np.linspace(0, 9, 200))
+        first = asyncio.run(detect_patterns({"data": short}))
+        asyncio.run(detect_patterns({"data": long}))
+        assert asyncio.run(detect_patterns({"data": short})) == first
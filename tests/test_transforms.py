@@ -0,0 +1,50 @@
+"""
+Tests for the Chavez Transform
+
+The fixed-grid transform must agree with the adaptive quadrature it
+replaces on the request path.
+"""
+
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from cailculator_mcp.transforms import (
+    ChavezTransform,
+    create_canonical_six_pattern,
+    gaussian_mixture,
+)
+
+
+def mixture(data):
+    """Scalar-point and batched versions of the same Gaussian mixture."""
+    data = np.asarray(data, dtype=np.float64)
+    centers = np.linspace(-5, 5, len(data))
+    f_point = lambda x: float(data @ np.exp(-(x[0] - centers) ** 2))
+    f_batch = lambda xs: gaussian_mixture(xs, centers, data)
+    return f_point, f_batch
+
+
+class TestTransform1dBatched:
+    """Test the Gauss-Legendre transform against adaptive quadrature."""
+
+    @pytest.mark.parametrize("alpha, d", [(0.1, 1), (1.0, 2), (10.0, 3), (1000.0, 2)])
+    def test_matches_adaptive(self, alpha, d):
+        """Agrees with the adaptive closed-form-kernel integral."""
+        f_point, f_batch = mixture(np.random.default_rng(0).standard_normal(20))
+        ct = ChavezTransform(dimension=32, alpha=alpha)
+        P, Q = create_canonical_six_pattern(3)
+        expected = ct.transform_1d_batch(f_point, [(P, Q)], d)[0]
+        assert ct.transform_1d_batched(f_batch, P, Q, d) == pytest.approx(expected, rel=1e-8)
+
+    def test_gaussian_mixture(self):
+        """Batched evaluation equals the explicit sum at each point."""
+        data = np.array([0.5, 2.0, -1.0])
+        xs = np.array([-5.0, -0.3, 0.0, 4.2])
+        expected = [sum(v * np.exp(-(x - t) ** 2) for v, t in zip(data, (-5.0, 0.0, 5.0))) for x in xs]
+        np.testing.assert_allclose(gaussian_mixture(xs, np.array([-5.0, 0.0, 5.0]), data), expected)